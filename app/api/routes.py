@@ -1,13 +1,17 @@
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fast_cache_middleware import CacheConfig, CacheDropConfig
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse, Response
 
 router = APIRouter()
 
-
-@router.get("/items")
-async def get_items() -> Dict[str, Any]:
-    return {
+# The item listing never changes at runtime, so the whole response is built once
+# at import and the same instance is returned on every request. Starlette only
+# reads its body, status and headers when sending, so sharing it is safe.
+_ITEMS_RESPONSE = ORJSONResponse(
+    {
         "items": [
             {"id": 1, "name": "Item 1", "version": "1.0"},
             {"id": 2, "name": "Item 2", "version": "1.0"},
@@ -17,15 +21,39 @@ async def get_items() -> Dict[str, Any]:
         "total": 3,
         "deployment_test": "blue-green-pattern-active",
     }
+)
+
+_MAX_ITEM_ID = 100
+_NAME_PREFIX = "Item "
+# Unknown IDs are a normal outcome, so answer them with a plain response rather
+# than raising HTTPException through the exception middleware. A fresh Response
+# wraps the pre-encoded body each time because FastCacheMiddleware appends
+# headers to the response it sees.
+_ITEM_NOT_FOUND_BODY = orjson.dumps({"detail": "Item not found"})
+# Every valid non-negative ID's payload, built once and indexed by ID.
+_ITEM_RESPONSES = tuple(
+    {"id": i, "name": _NAME_PREFIX + str(i), "version": "1.0", "api_version": "v1"} for i in range(_MAX_ITEM_ID + 1)
+)
+
+
+# Not behind FastCacheMiddleware: a cache lookup costs more than returning the
+# pre-built response, and the middleware appends headers to the shared instance.
+@router.get("/items")
+async def get_items() -> ORJSONResponse:
+    return _ITEMS_RESPONSE
 
 
-@router.get("/items/{item_id}")
-async def get_item(item_id: int) -> Dict[str, Any]:
-    if item_id > 100:
-        raise HTTPException(status_code=404, detail="Item not found")
-    return {"id": item_id, "name": f"Item {item_id}", "version": "1.0", "api_version": "v1"}
+@router.get("/items/{item_id}", response_model=Dict[str, Any], dependencies=[CacheConfig(max_age=300)])
+async def get_item(item_id: int) -> Union[Dict[str, Any], Response]:
+    if 0 <= item_id <= _MAX_ITEM_ID:
+        return _ITEM_RESPONSES[item_id]
+    if item_id > _MAX_ITEM_ID:
+        return Response(content=_ITEM_NOT_FOUND_BODY, status_code=404, media_type="application/json")
+    # Negative IDs are accepted but rare, so they are not pre-built
+    return {"id": item_id, "name": _NAME_PREFIX + str(item_id), "version": "1.0", "api_version": "v1"}
 
 
-@router.post("/items")
+# Creating an item drops every cached item read.
+@router.post("/items", dependencies=[CacheDropConfig(methods=[get_item])])
 async def create_item(item: Dict[str, Any]) -> Dict[str, Any]:
     return {"message": "Item created", "item": item}
@@ -1,13 +1,27 @@
 import os
 from functools import lru_cache
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
+from dotenv import dotenv_values
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Whether this process runs on EC2 cannot change while it is alive, so probe
+# the cloud-init instance directory once instead of on every validation.
+_ON_EC2 = os.path.exists("/var/lib/cloud/instance")
+
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+# Parse .env once per process and hand the values to Settings explicitly, rather
+# than having pydantic-settings locate and re-read the file. Real environment
+# variables still override .env values.
+_ENV: Dict[str, Optional[str]] = {**dotenv_values(".env"), **os.environ}
+
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, extra="ignore")
+    # Frozen: settings never change after startup, and skipping per-assignment
+    # validation keeps the model cheap; updates go through model_copy().
+    model_config = SettingsConfigDict(case_sensitive=False, extra="ignore", frozen=True)
 
     app_name: str = "FastAPI AWS App"
     environment: str = "development"
@@ -19,6 +33,11 @@ class Settings(BaseSettings):
     aws_secret_access_key: str = ""
     aws_session_token: str = ""
 
+    # CORS configuration (comma-separated so it can be set from a plain env var)
+    cors_origins: str = Field(
+        default="http://localhost:3000,http://localhost:8000", description="Comma-separated allowed CORS origins"
+    )
+
     # Secrets Manager configuration (always enabled in production)
     use_secrets_manager: bool = Field(default=True, description="Enable AWS Secrets Manager")
     app_secrets_name: str = Field(default="FastAPIAppSecrets", description="Name of app secrets in Secrets Manager")
@@ -33,33 +52,44 @@ class Settings(BaseSettings):
     @classmethod
     def check_ec2_environment(cls, v: Any) -> bool:
         """Auto-enable Secrets Manager when running on EC2."""
-        # Check if running on EC2 by looking for instance metadata
-        if os.path.exists("/var/lib/cloud/instance"):
-            return True
-        # Also check for explicit environment variable
-        return os.getenv("USE_SECRETS_MANAGER", str(v)).lower() in ("true", "1", "yes")
-
-    def load_from_secrets_manager(self) -> None:
-        """Load secrets from AWS Secrets Manager if enabled."""
+        # Running on EC2 (instance metadata present) or explicitly enabled via env var
+        return _ON_EC2 or os.getenv("USE_SECRETS_MANAGER", str(v)).lower() in _TRUTHY
+
+    def load_from_secrets_manager(self) -> "Settings":
+        """Return settings with secrets loaded from AWS Secrets Manager if enabled.
+
+        Settings are immutable, so this returns an updated copy (or ``self`` when
+        nothing was loaded).
+        """
         if not self.use_secrets_manager:
-            return
+            return self
 
         try:
-            from app.secrets_manager import get_app_secret
+            from app.secrets_manager import get_secrets_manager
 
-            # Load application secrets
-            self.db_password = get_app_secret("db_password", self.db_password)
-            self.jwt_secret = get_app_secret("jwt_secret", self.jwt_secret)
-            self.api_keys = get_app_secret("api_keys", self.api_keys)
+            # Load application secrets in a single round-trip; this also primes the
+            # secrets cache for later lookups. Environment variables still take
+            # precedence for local development.
+            secrets = get_secrets_manager().get_secret(self.app_secrets_name)
+            return self.model_copy(
+                update={
+                    "db_password": os.getenv("DB_PASSWORD") or secrets.get("db_password", self.db_password),
+                    "jwt_secret": os.getenv("JWT_SECRET") or secrets.get("jwt_secret", self.jwt_secret),
+                    "api_keys": os.getenv("API_KEYS") or secrets.get("api_keys", self.api_keys),
+                }
+            )
 
         except ImportError:
             print("Warning: secrets_manager module not found, skipping Secrets Manager integration")
         except Exception as e:
             print(f"Warning: Failed to load secrets from Secrets Manager: {e}")
+        return self
 
 
+# Cached so every caller (and FastAPI dependency) shares one Settings instance
 @lru_cache()
 def get_settings() -> Settings:
-    settings = Settings()
-    settings.load_from_secrets_manager()
-    return settings
+    values: Dict[str, Any] = {
+        key.lower(): value for key, value in _ENV.items() if value is not None and key.lower() in Settings.model_fields
+    }
+    return Settings(**values).load_from_secrets_manager()
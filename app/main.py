@@ -1,41 +1,75 @@
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+import orjson
+from fast_cache_middleware import FastCacheMiddleware
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from app.api import routes
 from app.config import get_settings
+from app.secrets_manager import get_secrets_manager
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Application secrets are already cached by get_settings(); warm the deployment
+    # secret too so the first request after a deploy does not pay the round-trip.
+    if settings.use_secrets_manager:
+        try:
+            await get_secrets_manager().get_secret_async(settings.deployment_secrets_name)
+        except Exception as e:
+            print(f"Warning: Failed to warm Secrets Manager cache: {e}")
+    yield
+
+
 app = FastAPI(
     title=settings.app_name,
     version="1.1.0",
     description="FastAPI application deployed on AWS EC2 with CI/CD",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Serves GET routes declaring a CacheConfig dependency from an in-process cache.
+# Added before CORSMiddleware so CORS stays outermost and still decorates cache hits.
+app.add_middleware(FastCacheMiddleware)
+
+# Explicit origins/methods/headers let CORSMiddleware answer preflights from pre-built
+# headers instead of echoing request headers; browsers cache preflights for a day.
+# Origins are lowercased because browsers send lowercase hosts and matching is exact.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[origin.strip().lower() for origin in settings.cors_origins.split(",") if origin.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,
 )
 
 app.include_router(routes.router, prefix=settings.api_v1_prefix)
 
 
-@app.get("/")
-async def root() -> dict[str, Any]:
-    return {
+# Settings are fixed for the life of the process, so the root payload is too.
+_ROOT_BODY = orjson.dumps(
+    {
         "message": "Welcome to FastAPI AWS App with PR Checks",
         "environment": settings.environment,
         "version": "1.1.0",
         "api_version": "v1",
         "features": ["API versioning", "Containerized deployment"],
     }
+)
+
+
+@app.get("/")
+async def root() -> Response:
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -5,31 +5,60 @@ This module provides utilities to fetch secrets from AWS Secrets Manager,
 enabling centralized secret management without hardcoding credentials.
 """
 
-import json
+import asyncio
 import os
-from functools import lru_cache
-from typing import Any, Dict, Optional
+import time
+from functools import cache, lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Tuned client settings: a larger pool of keep-alive connections so concurrent
+# lookups reuse warm TLS sockets, and short timeouts with adaptive retries so a
+# slow endpoint fails fast instead of stalling request handling.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    connect_timeout=2,
+    read_timeout=5,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+# Dedicated session so client creation does not contend on boto3's default session.
+_session = boto3.session.Session()
+
 
 class SecretsManager:
     """Handle AWS Secrets Manager operations."""
 
-    def __init__(self, region_name: Optional[str] = None):
+    def __init__(self, region_name: Optional[str] = None, ttl_seconds: float = 300):
         """Initialize Secrets Manager client.
 
         Args:
             region_name: AWS region. Defaults to AWS_REGION env var or us-east-1.
+            ttl_seconds: How long a fetched secret is served from cache before refetching.
         """
         self.region_name = region_name or os.getenv("AWS_REGION", "us-east-1")
-        self.client = boto3.client("secretsmanager", region_name=self.region_name)
+        self.ttl_seconds = ttl_seconds
+        self.client = _session.client("secretsmanager", region_name=self.region_name, config=_CLIENT_CONFIG)
+        # secret name -> (monotonic fetch time, secret data)
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def _get_cached(self, secret_name: str) -> Optional[Dict[str, Any]]:
+        """Return the cached secret if it is still within ``ttl_seconds``."""
+        hit = self._cache.get(secret_name)
+        if hit is not None and time.monotonic() - hit[0] < self.ttl_seconds:
+            return hit[1]
+        return None
 
-    @lru_cache(maxsize=32)
     def get_secret(self, secret_name: str) -> Dict[str, Any]:
         """Retrieve secret from AWS Secrets Manager.
 
+        Fetched secrets are cached for ``ttl_seconds`` so repeat lookups skip the API call.
+
         Args:
             secret_name: Name or ARN of the secret.
 
@@ -39,12 +68,17 @@ class SecretsManager:
         Raises:
             ClientError: If secret cannot be retrieved.
         """
+        cached = self._get_cached(secret_name)
+        if cached is not None:
+            return cached
+
         try:
             response = self.client.get_secret_value(SecretId=secret_name)
 
             # Secrets Manager returns either SecretString or SecretBinary
             if "SecretString" in response:
-                secret_data: Dict[str, Any] = json.loads(response["SecretString"])
+                secret_data: Dict[str, Any] = orjson.loads(response["SecretString"])
+                self._cache[secret_name] = (time.monotonic(), secret_data)
                 return secret_data
             else:
                 # Binary secrets are not supported in this implementation
@@ -76,21 +110,50 @@ class SecretsManager:
         except (ValueError, PermissionError):
             return default
 
+    async def get_secret_async(self, secret_name: str) -> Dict[str, Any]:
+        """Async variant of :meth:`get_secret` for use on the event loop.
+
+        Cache hits return immediately; misses run the blocking boto3 call in a
+        worker thread so other requests keep being served meanwhile.
+        """
+        cached = self._get_cached(secret_name)
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self.get_secret, secret_name)
+
+    async def get_secret_value_async(self, secret_name: str, key: str, default: Any = None) -> Any:
+        """Async variant of :meth:`get_secret_value`."""
+        try:
+            secret = await self.get_secret_async(secret_name)
+            return secret.get(key, default)
+        except (ValueError, PermissionError):
+            return default
+
+
+@lru_cache(maxsize=128)
+def _env_override(key: str) -> Optional[str]:
+    """Memoized lookup of the environment variable overriding a secret key.
+
+    The environment is fixed once the process has started, so repeat lookups are
+    served from cache. Call ``_env_override.cache_clear()`` after changing it.
+    """
+    return os.getenv(key.upper())
+
 
-# Global instance for easy access
-_secrets_manager: Optional[SecretsManager] = None
+@lru_cache(maxsize=128)
+def _getenv(name: str, default: str) -> str:
+    """Memoized ``os.getenv`` for secret-name configuration."""
+    return os.getenv(name, default)
 
 
+@cache
 def get_secrets_manager() -> SecretsManager:
     """Get or create global SecretsManager instance.
 
     Returns:
         SecretsManager instance.
     """
-    global _secrets_manager
-    if _secrets_manager is None:
-        _secrets_manager = SecretsManager()
-    return _secrets_manager
+    return SecretsManager()
 
 
 def get_app_secret(key: str, default: Any = None) -> Any:
@@ -104,12 +167,12 @@ def get_app_secret(key: str, default: Any = None) -> Any:
         The secret value.
     """
     # Try to get from environment variable first (for local development)
-    env_value = os.getenv(key.upper())
+    env_value = _env_override(key)
     if env_value:
         return env_value
 
     # Then try Secrets Manager
-    secret_name = os.getenv("APP_SECRETS_NAME", "FastAPIAppSecrets")
+    secret_name = _getenv("APP_SECRETS_NAME", "FastAPIAppSecrets")
     try:
         return get_secrets_manager().get_secret_value(secret_name, key, default)
     except Exception:
@@ -127,7 +190,7 @@ def get_deployment_secret(key: str, default: Any = None) -> Any:
     Returns:
         The secret value.
     """
-    secret_name = os.getenv("DEPLOYMENT_SECRETS_NAME", "FastAPIDeploymentSecrets")
+    secret_name = _getenv("DEPLOYMENT_SECRETS_NAME", "FastAPIDeploymentSecrets")
     try:
         return get_secrets_manager().get_secret_value(secret_name, key, default)
     except Exception:
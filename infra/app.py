@@ -36,6 +36,15 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def required_env(name: str) -> str:
+    """Return an environment variable, failing synthesis when it is unset."""
+    value = os.getenv(name)
+    if not value:
+        raise SystemExit(f"{name} must be set (comma-separated browser origins for that environment)")
+    return value
+
+
 app = App()
 
 # AWS Environment Configuration
@@ -56,6 +65,7 @@ staging_stack = EC2Stack(
     env=env,
     environment_name="staging",
     repository_url=repository_url,
+    cors_origins=required_env("STAGING_CORS_ORIGINS"),
     instance_type="t3.micro",  # Cost optimization for staging
     min_capacity=1,
     max_capacity=2,  # Allows rollback deployments
@@ -72,6 +82,7 @@ production_blue_stack = EC2Stack(
     env=env,
     environment_name="production-blue",
     repository_url=repository_url,
+    cors_origins=required_env("PRODUCTION_BLUE_CORS_ORIGINS"),
     instance_type="t3.small",  # Production-grade performance
     min_capacity=1,
     max_capacity=2,  # Allows rollback deployments
@@ -87,6 +98,7 @@ production_green_stack = EC2Stack(
     env=env,
     environment_name="production-green",
     repository_url=repository_url,
+    cors_origins=required_env("PRODUCTION_GREEN_CORS_ORIGINS"),
     instance_type="t3.small",  # Production-grade performance
     min_capacity=2,  # Higher minimum for production availability
     max_capacity=3,  # Higher maximum for production scaling
@@ -24,6 +24,9 @@ Deployment scenarios:
 - Multi-region: Parameterized region configuration supports geographic distribution
 """
 
+import os
+import textwrap
+
 from aws_cdk import (
     Stack,
     aws_ec2 as ec2,
@@ -33,6 +36,7 @@ from aws_cdk import (
     aws_secretsmanager as secretsmanager,
     aws_autoscaling as autoscaling,
     aws_ecr as ecr,
+    aws_s3_assets as s3_assets,
     CfnOutput,
     Tags,
     RemovalPolicy,
@@ -41,6 +45,10 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+__all__ = ["EC2Stack"]
+
+_ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "assets")
+
 
 class EC2Stack(Stack):
     """
@@ -73,6 +81,7 @@ class EC2Stack(Stack):
         construct_id: str, 
         environment_name: str,
         repository_url: str,
+        cors_origins: str,
         instance_type: str = "t3.micro",
         min_capacity: int = 1,
         max_capacity: int = 2,
@@ -84,6 +93,7 @@ class EC2Stack(Stack):
         Args:
             environment_name: Environment identifier (staging/production)
             repository_url: GitHub repository URL for application source
+            cors_origins: Comma-separated browser origins allowed by the API
             instance_type: EC2 instance type for the environment
             min_capacity: Minimum number of instances in Auto Scaling Group
             max_capacity: Maximum number of instances (enables rollback deployments)
@@ -106,6 +116,7 @@ class EC2Stack(Stack):
         self.instance_type = instance_type
         self.min_capacity = min_capacity
         self.max_capacity = max_capacity
+        self.cors_origins = cors_origins
         
         # VPC Configuration
         # Why: Isolated network environment with public/private subnet separation
@@ -317,38 +328,48 @@ class EC2Stack(Stack):
         # Why: Automates Docker container deployment and configuration on instance startup
         # How: Installs Docker, authenticates with ECR, and runs containerized application
         user_data = ec2.UserData.for_linux()
-        user_data.add_commands(
-            # System updates and Docker installation
-            "yum update -y",
-            "yum install -y docker aws-cli",
-            "systemctl start docker",
-            "systemctl enable docker",
-            "usermod -a -G docker ec2-user",
-            
+        
+        # systemd unit shipped as an S3 asset rather than inlined in the template
+        # Why: Keeps the synthesized UserData small and diff-friendly
+        # How: Instance downloads the file; per-stack values come from /etc/fastapi.env
+        service_unit = s3_assets.Asset(
+            self, "FastAPIServiceUnit",
+            path=os.path.join(_ASSETS_DIR, "fastapi.service")
+        )
+        service_unit.grant_read(role)
+        
+        user_data.add_commands(textwrap.dedent(f"""\
+            # Fetch the ECR login token and the service unit (AL2023 ships aws-cli v2)
+            # in the background while packages install, then wait for both
+            ECR_TOKEN_FILE=$(mktemp)
+            aws ecr get-login-password --region {self.region} > "$ECR_TOKEN_FILE" &
+            ECR_PID=$!
+            aws s3 cp {service_unit.s3_object_url} /etc/systemd/system/fastapi.service &
+            UNIT_PID=$!
+
+            # System updates and Docker installation; awscli-2 is left alone so the
+            # running fetches never see their package replaced underneath them
+            yum update -y --exclude=awscli-2
+            yum install -y docker
+            systemctl start docker
+            systemctl enable docker
+            usermod -a -G docker ec2-user
+            wait "$ECR_PID" && wait "$UNIT_PID" || exit 1
+
             # ECR authentication and image pull
-            f"aws ecr get-login-password --region {self.region} | docker login --username AWS --password-stdin {ecr_repository.repository_uri}",
-            f"docker pull {ecr_repository.repository_uri}:latest",
-            
+            docker login --username AWS --password-stdin {ecr_repository.repository_uri} < "$ECR_TOKEN_FILE"
+            rm -f "$ECR_TOKEN_FILE"
+            docker pull {ecr_repository.repository_uri}:latest
+
+            # Values read by the fastapi.service unit
+            cat > /etc/fastapi.env << 'EOF'
+            IMAGE_URI={ecr_repository.repository_uri}:latest
+            AWS_DEFAULT_REGION={self.region}
+            CORS_ORIGINS={self.cors_origins}
+            EOF
+
             # Run containerized application as systemd service
-            "cat > /etc/systemd/system/fastapi.service << 'EOF'",
-            "[Unit]",
-            "Description=FastAPI Docker Container",
-            "After=docker.service",
-            "Requires=docker.service",
-            "",
-            "[Service]",
-            "Type=simple",
-            "User=ec2-user",
-            f"ExecStart=/usr/bin/docker run --rm --name fastapi-app -p 8000:8000 -e USE_SECRETS_MANAGER=true -e AWS_DEFAULT_REGION={self.region} {ecr_repository.repository_uri}:latest",
-            "ExecStop=/usr/bin/docker stop fastapi-app",
-            "Restart=always",
-            "",
-            "[Install]",
-            "WantedBy=multi-user.target",
-            "EOF",
-            "systemctl enable fastapi",
-            "systemctl start fastapi"
-        )
+            systemctl enable --now fastapi"""))
         
         # Launch Template for Auto Scaling Group
         # Why: Defines instance configuration for consistent deployments
@@ -6,57 +6,114 @@ Usage:
     python scripts/manage_secrets.py --help
     python scripts/manage_secrets.py get-app-secret jwt_secret
     python scripts/manage_secrets.py set-app-secret jwt_secret "my-secret-value"
+    python scripts/manage_secrets.py set-app-secret jwt_secret=my-jwt db_password=my-db-password
     python scripts/manage_secrets.py get-deployment-secret ec2_host
     python scripts/manage_secrets.py set-deployment-secret ec2_key_name "my-key-pair"
 """
 
 import argparse
-import json
+import functools
 import sys
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import boto3
-from botocore.exceptions import ClientError
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # the CLI also runs outside the app's virtualenv
+    import json
+
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+@functools.cache
+def _client_config() -> Any:
+    """Pooled connections and adaptive retries for bulk list/set runs."""
+    from botocore.config import Config
+
+    return Config(max_pool_connections=32, retries={"mode": "adaptive", "max_attempts": 5})
+
+
+# Sessions keyed by profile and clients keyed by (region, profile), so each
+# identity resolves credentials and opens its TLS connections once per process.
+_SESSIONS: Dict[Optional[str], Any] = {}
+_CLIENTS: Dict[Tuple[str, Optional[str]], Any] = {}
+
+
+def _get_client(region: str, profile: Optional[str] = None) -> Any:
+    """Return the cached Secrets Manager client for a region and profile."""
+    key = (region, profile)
+    client = _CLIENTS.get(key)
+    if client is None:
+        session = _SESSIONS.get(profile)
+        if session is None:
+            # boto3/botocore are imported on first use so --help and argument
+            # errors run on the standard library alone
+            import boto3
+
+            session = _SESSIONS[profile] = boto3.session.Session(profile_name=profile)
+        client = _CLIENTS[key] = session.client("secretsmanager", region_name=region, config=_client_config())
+    return client
 
 
 class SecretsManagerCLI:
     """Command-line interface for AWS Secrets Manager."""
     
-    def __init__(self, region: str = "us-east-1"):
-        """Initialize the CLI with AWS region."""
-        self.client = boto3.client("secretsmanager", region_name=region)
+    def __init__(self, region: str = "us-east-1", client: Any = None, profile: Optional[str] = None):
+        """Initialize the CLI with AWS region.
+
+        Uses ``client`` when given, otherwise the cached client for the region/profile.
+        """
+        self.client = client or _get_client(region, profile)
         self.app_secret_name = "FastAPIAppSecrets"
         self.deployment_secret_name = "FastAPIDeploymentSecrets"
+        # Whether each secret exists, as learned from earlier calls, so writes
+        # can pick update vs create up front instead of failing over.
+        self._exists: Dict[str, bool] = {}
     
     def get_secret(self, secret_name: str) -> Dict[str, Any]:
         """Retrieve a secret from AWS Secrets Manager."""
         try:
             response = self.client.get_secret_value(SecretId=secret_name)
-            return json.loads(response["SecretString"])
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                print(f"Secret {secret_name} not found")
-                return {}
-            raise
+        except self.client.exceptions.ResourceNotFoundException:
+            self._exists[secret_name] = False
+            print(f"Secret {secret_name} not found")
+            return {}
+        self._exists[secret_name] = True
+        return _loads(response["SecretString"])
+    
+    def _secret_exists(self, secret_name: str) -> bool:
+        """Return whether a secret exists, using describe_secret (no payload) on first use."""
+        exists = self._exists.get(secret_name)
+        if exists is None:
+            try:
+                self.client.describe_secret(SecretId=secret_name)
+                exists = True
+            except self.client.exceptions.ResourceNotFoundException:
+                exists = False
+            self._exists[secret_name] = exists
+        return exists
     
     def update_secret(self, secret_name: str, secret_dict: Dict[str, Any]):
-        """Update a secret in AWS Secrets Manager."""
-        try:
+        """Update a secret in AWS Secrets Manager, creating it if it doesn't exist."""
+        if self._secret_exists(secret_name):
             self.client.update_secret(
                 SecretId=secret_name,
-                SecretString=json.dumps(secret_dict)
+                SecretString=_dumps(secret_dict)
             )
             print(f"Successfully updated secret: {secret_name}")
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                # Create the secret if it doesn't exist
-                self.client.create_secret(
-                    Name=secret_name,
-                    SecretString=json.dumps(secret_dict)
-                )
-                print(f"Successfully created secret: {secret_name}")
-            else:
-                raise
+        else:
+            self.client.create_secret(
+                Name=secret_name,
+                SecretString=_dumps(secret_dict)
+            )
+            self._exists[secret_name] = True
+            print(f"Successfully created secret: {secret_name}")
     
     def get_app_secret(self, key: str):
         """Get a specific key from application secrets."""
@@ -68,12 +125,45 @@ class SecretsManagerCLI:
             print(f"Key '{key}' not found in application secrets")
         return value
     
-    def set_app_secret(self, key: str, value: str):
-        """Set a specific key in application secrets."""
-        secrets = self.get_secret(self.app_secret_name)
-        secrets[key] = value
-        self.update_secret(self.app_secret_name, secrets)
-        print(f"Set {key} in application secrets")
+    def _set_secrets(
+        self,
+        secret_name: str,
+        kv: Dict[str, str],
+        label: str,
+        secrets: Optional[Dict[str, Any]] = None,
+        exists: Optional[bool] = None,
+    ):
+        """Merge ``kv`` into a secret with one read and at most one write.
+
+        No write is issued when every key already holds the requested value.
+        """
+        if exists is not None:
+            self._exists[secret_name] = exists
+        if secrets is None:
+            secrets = self.get_secret(secret_name)
+        if all(secrets.get(key) == value for key, value in kv.items()):
+            # Re-seeding identical values would only bump the secret version
+            print(f"{', '.join(kv)} already set in {label} secrets")
+            return
+        updated = {**secrets, **kv}
+        self.update_secret(secret_name, updated)
+        print(f"Set {', '.join(kv)} in {label} secrets")
+    
+    def set_app_secrets(
+        self, kv: Dict[str, str], secrets: Optional[Dict[str, Any]] = None, exists: Optional[bool] = None
+    ):
+        """Set several keys in application secrets with a single update."""
+        self._set_secrets(self.app_secret_name, kv, "application", secrets, exists)
+    
+    def set_app_secret(
+        self, key: str, value: str, secrets: Optional[Dict[str, Any]] = None, exists: Optional[bool] = None
+    ):
+        """Set a specific key in application secrets.
+
+        When the current secret dict is already known, pass it as ``secrets`` and
+        whether the secret exists as ``exists`` to write without any read.
+        """
+        self.set_app_secrets({key: value}, secrets, exists)
     
     def get_deployment_secret(self, key: str):
         """Get a specific key from deployment secrets."""
@@ -85,30 +175,69 @@ class SecretsManagerCLI:
             print(f"Key '{key}' not found in deployment secrets")
         return value
     
-    def set_deployment_secret(self, key: str, value: str):
-        """Set a specific key in deployment secrets."""
-        secrets = self.get_secret(self.deployment_secret_name)
-        secrets[key] = value
-        self.update_secret(self.deployment_secret_name, secrets)
-        print(f"Set {key} in deployment secrets")
+    def set_deployment_secrets(
+        self, kv: Dict[str, str], secrets: Optional[Dict[str, Any]] = None, exists: Optional[bool] = None
+    ):
+        """Set several keys in deployment secrets with a single update."""
+        self._set_secrets(self.deployment_secret_name, kv, "deployment", secrets, exists)
+    
+    def set_deployment_secret(
+        self, key: str, value: str, secrets: Optional[Dict[str, Any]] = None, exists: Optional[bool] = None
+    ):
+        """Set a specific key in deployment secrets.
+
+        When the current secret dict is already known, pass it as ``secrets`` and
+        whether the secret exists as ``exists`` to write without any read.
+        """
+        self.set_deployment_secrets({key: value}, secrets, exists)
+    
+    def get_secrets(self, secret_names: List[str]) -> List[Dict[str, Any]]:
+        """Retrieve several secrets concurrently, returned in the order requested.
+
+        botocore clients are thread-safe, so the workers share ``self.client``.
+        """
+        with ThreadPoolExecutor(max_workers=len(secret_names) or 1) as executor:
+            return list(executor.map(self.get_secret, secret_names))
     
     def list_secrets(self):
         """List all secrets and their keys."""
+        app_secrets, deployment_secrets = self.get_secrets(
+            [self.app_secret_name, self.deployment_secret_name]
+        )
+        
         print("\n=== Application Secrets ===")
-        app_secrets = self.get_secret(self.app_secret_name)
-        for key in app_secrets:
-            print(f"  - {key}")
+        _write_keys(app_secrets)
         
         print("\n=== Deployment Secrets ===")
-        deployment_secrets = self.get_secret(self.deployment_secret_name)
-        for key in deployment_secrets:
-            print(f"  - {key}")
+        _write_keys(deployment_secrets)
 
 
-def main():
-    """Main CLI entry point."""
+def _write_keys(keys: Iterable[str]):
+    """Write a bulleted key list to stdout in a single call."""
+    lines = "".join(f"  - {key}\n" for key in keys)
+    if lines:
+        sys.stdout.write(lines)
+
+
+def _parse_kv(parser: argparse.ArgumentParser, items: list) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` pairs, also accepting the original single ``KEY VALUE`` form."""
+    if len(items) == 2 and "=" not in items[0]:
+        kv = {items[0]: items[1]}
+    elif all("=" in item for item in items):
+        kv = dict(item.split("=", 1) for item in items)
+    else:
+        parser.error("expected KEY=VALUE pairs or a single KEY VALUE")
+    if "" in kv:
+        parser.error("secret keys must not be empty")
+    return kv
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once per process."""
     parser = argparse.ArgumentParser(description="Manage AWS Secrets Manager secrets")
     parser.add_argument("--region", default="us-east-1", help="AWS region")
+    parser.add_argument("--profile", default=None, help="AWS profile (defaults to the standard credential chain)")
     
     subparsers = parser.add_subparsers(dest="command", help="Commands")
     
@@ -120,26 +249,30 @@ def main():
     get_app.add_argument("key", help="Secret key to retrieve")
     
     # Set app secret
-    set_app = subparsers.add_parser("set-app-secret", help="Set application secret value")
-    set_app.add_argument("key", help="Secret key to set")
-    set_app.add_argument("value", help="Secret value to set")
+    set_app = subparsers.add_parser("set-app-secret", help="Set application secret value(s)")
+    set_app.add_argument("kv", nargs="+", metavar="KEY=VALUE", help="Pairs to set in one update (or a single KEY VALUE)")
     
     # Get deployment secret
     get_deploy = subparsers.add_parser("get-deployment-secret", help="Get deployment secret value")
     get_deploy.add_argument("key", help="Secret key to retrieve")
     
     # Set deployment secret
-    set_deploy = subparsers.add_parser("set-deployment-secret", help="Set deployment secret value")
-    set_deploy.add_argument("key", help="Secret key to set")
-    set_deploy.add_argument("value", help="Secret value to set")
+    set_deploy = subparsers.add_parser("set-deployment-secret", help="Set deployment secret value(s)")
+    set_deploy.add_argument("kv", nargs="+", metavar="KEY=VALUE", help="Pairs to set in one update (or a single KEY VALUE)")
     
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         return
     
-    cli = SecretsManagerCLI(region=args.region)
+    cli = SecretsManagerCLI(region=args.region, profile=args.profile)
     
     try:
         if args.command == "list":
@@ -147,11 +280,11 @@ def main():
         elif args.command == "get-app-secret":
             cli.get_app_secret(args.key)
         elif args.command == "set-app-secret":
-            cli.set_app_secret(args.key, args.value)
+            cli.set_app_secrets(_parse_kv(parser, args.kv))
         elif args.command == "get-deployment-secret":
             cli.get_deployment_secret(args.key)
         elif args.command == "set-deployment-secret":
-            cli.set_deployment_secret(args.key, args.value)
+            cli.set_deployment_secrets(_parse_kv(parser, args.kv))
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
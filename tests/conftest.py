@@ -1,21 +1,70 @@
+import copy
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Heavy imports happen here, once per xdist worker before collection, rather
+# than piecemeal as each test module is imported
+import boto3  # noqa: F401
+import botocore.exceptions  # noqa: F401
+import httpx
 
+from app import secrets_manager  # noqa: F401
 from app.main import app
 from app.config import Settings, get_settings
 
+_SAMPLE_ITEMS = (
+    {"id": 1, "name": "Item 1"},
+    {"id": 2, "name": "Item 2"},
+    {"id": 3, "name": "Item 3"},
+)
 
-@pytest.fixture
-def test_client():
-    return TestClient(app)
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast", action="store_true", default=False,
+        help="skip tests marked integration for quick local iterations"
+    )
 
-@pytest.fixture
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--fast"):
+        return
+    skip_integration = pytest.mark.skip(reason="--fast")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_responses():
+    """Decode test responses with orjson instead of the stdlib json module."""
+    stdlib_json = httpx.Response.json
+
+    def json(self, **kwargs):
+        return stdlib_json(self, **kwargs) if kwargs else orjson.loads(self.content)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", json)
+        yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def items_response(client):
+    # GET /items serves static seed data that POSTs never change, so one
+    # response can back every read-only assertion on it
+    return client.get("/api/v1/items")
+
+
+@pytest.fixture(scope="session")
 def mock_settings():
     test_settings = Settings(
         app_name="Test App",
@@ -33,7 +82,7 @@ def override_settings(mock_settings):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_item():
     return {
         "id": 1,
@@ -42,10 +91,11 @@ def sample_item():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_items_list():
-    return [
-        {"id": 1, "name": "Item 1"},
-        {"id": 2, "name": "Item 2"},
-        {"id": 3, "name": "Item 3"}
-    ]
\ No newline at end of file
+    return _SAMPLE_ITEMS
+
+
+@pytest.fixture
+def mutable_sample_items_list():
+    return copy.deepcopy(list(_SAMPLE_ITEMS))
@@ -1,8 +1,21 @@
 import pytest
-from unittest.mock import patch
+from functools import lru_cache
+from unittest.mock import Mock, patch
+from pydantic import ValidationError
 from app.config import Settings, get_settings
 
 
+@lru_cache(maxsize=None)
+def _cached_settings(env: frozenset) -> Settings:
+    with patch.dict('os.environ', dict(env)):
+        return Settings()
+
+
+def _build_settings(env: dict) -> Settings:
+    # Settings is frozen, so one instance per env combination can be shared
+    return _cached_settings(frozenset(env.items()))
+
+
 def test_default_settings():
     settings = Settings()
     assert settings.app_name == "FastAPI AWS App"
@@ -13,30 +26,80 @@ def test_default_settings():
 
 
 def test_settings_from_env():
-    with patch.dict('os.environ', {
+    settings = _build_settings({
         'APP_NAME': 'Test App',
         'ENVIRONMENT': 'production',
         'DEBUG': 'false',
         'AWS_REGION': 'us-west-2'
-    }):
+    })
+    assert settings.app_name == 'Test App'
+    assert settings.environment == 'production'
+    assert settings.debug is False
+    assert settings.aws_region == 'us-west-2'
+
+
+def test_secrets_manager_forced_on_ec2():
+    with patch('app.config._ON_EC2', True), patch.dict('os.environ', {'USE_SECRETS_MANAGER': 'false'}):
         settings = Settings()
-        assert settings.app_name == 'Test App'
-        assert settings.environment == 'production'
-        assert settings.debug is False
-        assert settings.aws_region == 'us-west-2'
+        assert settings.use_secrets_manager is True
 
 
 def test_get_settings_singleton():
+    # get_settings is lru_cached, so repeat calls return the same instance
     settings1 = get_settings()
     settings2 = get_settings()
     assert settings1 is settings2
 
 
+def test_get_settings_uses_preparsed_env():
+    get_settings.cache_clear()
+    try:
+        with patch('app.config._ENV', {
+            'APP_NAME': 'From Dotenv',
+            'USE_SECRETS_MANAGER': 'false',
+            'CDK_DEFAULT_ACCOUNT': 'account123'
+        }):
+            settings = get_settings()
+        assert settings.app_name == 'From Dotenv'
+        assert settings.use_secrets_manager is False
+    finally:
+        get_settings.cache_clear()
+
+
 def test_settings_extra_fields_ignored():
-    with patch.dict('os.environ', {
+    settings = _build_settings({
         'EXTRA_FIELD': 'should_be_ignored',
         'CDK_DEFAULT_ACCOUNT': 'account123'
-    }):
-        settings = Settings()
-        assert not hasattr(settings, 'extra_field')
-        assert not hasattr(settings, 'cdk_default_account')
\ No newline at end of file
+    })
+    assert not hasattr(settings, 'extra_field')
+    assert not hasattr(settings, 'cdk_default_account')
+
+
+def test_load_from_secrets_manager_single_fetch(monkeypatch):
+    for key in ('DB_PASSWORD', 'JWT_SECRET', 'API_KEYS'):
+        monkeypatch.delenv(key, raising=False)
+    mock_sm = Mock()
+    mock_sm.get_secret.return_value = {"db_password": "sm-db", "jwt_secret": "sm-jwt", "api_keys": "sm-keys"}
+    settings = Settings(use_secrets_manager=True, app_secrets_name="TestAppSecrets")
+    with patch('app.secrets_manager.get_secrets_manager', return_value=mock_sm):
+        settings = settings.load_from_secrets_manager()
+    mock_sm.get_secret.assert_called_once_with("TestAppSecrets")
+    assert settings.db_password == "sm-db"
+    assert settings.jwt_secret == "sm-jwt"
+    assert settings.api_keys == "sm-keys"
+
+
+def test_load_from_secrets_manager_env_takes_precedence():
+    mock_sm = Mock()
+    mock_sm.get_secret.return_value = {"jwt_secret": "sm-jwt"}
+    settings = Settings(use_secrets_manager=True)
+    with patch.dict('os.environ', {'JWT_SECRET': 'env-jwt'}), \
+            patch('app.secrets_manager.get_secrets_manager', return_value=mock_sm):
+        settings = settings.load_from_secrets_manager()
+    assert settings.jwt_secret == "env-jwt"
+
+
+def test_settings_are_frozen():
+    settings = Settings()
+    with pytest.raises(ValidationError):
+        settings.debug = False
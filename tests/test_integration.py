@@ -1,62 +1,83 @@
+import asyncio
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+
 from app.main import app
 
-client = TestClient(app)
+_NEW_ITEM_999 = {"id": 999, "name": "Integration Test Item"}
 
 
 class TestAPIIntegration:
-    def test_full_api_flow(self):
-        response = client.get("/")
-        assert response.status_code == 200
-        data = response.json()
-        assert "api_version" in data
-        
-        response = client.get("/health")
-        assert response.status_code == 200
-        assert response.json()["status"] == "healthy"
-        
-        response = client.get("/api/v1/items")
-        assert response.status_code == 200
-        items = response.json()["items"]
-        
-        if items:
-            first_item_id = items[0]["id"]
-            response = client.get(f"/api/v1/items/{first_item_id}")
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        self.client = client
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_full_api_flow(self):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            # Independent reads go out together; the writes below depend on them
+            root, health, items_response = await asyncio.gather(
+                ac.get("/"), ac.get("/health"), ac.get("/api/v1/items")
+            )
+            assert root.status_code == 200
+            assert "api_version" in root.json()
+            
+            assert health.status_code == 200
+            assert health.json()["status"] == "healthy"
+            
+            assert items_response.status_code == 200
+            items = items_response.json()["items"]
+            
+            if items:
+                first_item_id = items[0]["id"]
+                response = await ac.get(f"/api/v1/items/{first_item_id}")
+                assert response.status_code == 200
+            
+            response = await ac.post("/api/v1/items", json=_NEW_ITEM_999)
             assert response.status_code == 200
-        
-        new_item = {"id": 999, "name": "Integration Test Item"}
-        response = client.post("/api/v1/items", json=new_item)
-        assert response.status_code == 200
-        assert response.json()["item"] == new_item
+            assert response.json()["item"] == _NEW_ITEM_999
     
     @pytest.mark.integration
-    def test_api_error_handling(self):
-        response = client.get("/nonexistent-endpoint")
-        assert response.status_code == 404
-        
-        response = client.get("/api/v1/items/999999")
-        assert response.status_code == 404
-        
-        response = client.post("/api/v1/items", data="invalid json")
-        assert response.status_code == 422
+    @pytest.mark.parametrize("method,path,body,expected_status", [
+        ("GET", "/nonexistent-endpoint", None, 404),
+        ("GET", "/api/v1/items/999999", None, 404),
+        ("POST", "/api/v1/items", "invalid json", 422),
+    ])
+    def test_api_error_handling(self, method, path, body, expected_status):
+        response = self.client.request(method, path, content=body)
+        assert response.status_code == expected_status
     
     @pytest.mark.integration
     def test_cors_headers(self):
-        response = client.options(
+        response = self.client.options(
             "/api/v1/items",
             headers={
-                "Origin": "http://example.com",
+                "Origin": "http://localhost:3000",
                 "Access-Control-Request-Method": "GET"
             }
         )
         assert "access-control-allow-origin" in response.headers
         # CORS reflects the origin when allow_credentials=True
-        assert response.headers["access-control-allow-origin"] == "http://example.com"
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-max-age"] == "86400"
+    
+    @pytest.mark.integration
+    def test_cors_rejects_unknown_origin(self):
+        response = self.client.options(
+            "/api/v1/items",
+            headers={
+                "Origin": "http://example.com",
+                "Access-Control-Request-Method": "GET"
+            }
+        )
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
     
     def test_api_versioning(self):
-        response = client.get("/api/v1/items")
+        response = self.client.get("/api/v1/items")
         assert response.status_code == 200
         
-        response = client.get("/api/v2/items")
+        response = self.client.get("/api/v2/items")
         assert response.status_code == 404
\ No newline at end of file
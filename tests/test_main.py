@@ -1,34 +1,66 @@
+from typing import Any, Tuple
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
-from app.main import app
+from app.main import app, settings
 
-client = TestClient(app)
+# Current API version: bump here instead of copying the tests
+api_schema = pytest.mark.parametrize("expected_version", ["1.1.0"])
 
 
-def test_read_root():
-    response = client.get("/")
-    assert response.status_code == 200
-    data = response.json()
+async def _call(path: str) -> Tuple[int, Any]:
+    """GET ``path`` by invoking the ASGI app directly, skipping the httpx transport."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return messages[0]["status"], orjson.loads(body)
+
+
+@pytest.mark.asyncio
+@api_schema
+async def test_read_root(expected_version):
+    status, data = await _call("/")
+    assert status == 200
     assert "message" in data
     assert data["message"] == "Welcome to FastAPI AWS App with PR Checks"
-    assert data["version"] == "1.1.0"
+    assert data["version"] == expected_version
     assert data["api_version"] == "v1"
     assert "features" in data
 
 
-def test_health_check():
-    response = client.get("/health")
-    assert response.status_code == 200
-    assert response.json() == {"status": "healthy"}
-
-
-def test_get_items():
-    response = client.get("/api/v1/items")
-    assert response.status_code == 200
-    assert "items" in response.json()
-    assert len(response.json()["items"]) == 3
+@pytest.mark.asyncio
+async def test_health_check():
+    status, data = await _call("/health")
+    assert status == 200
+    assert data == {"status": "healthy"}
 
 
-def test_get_item():
+def test_get_item(client):
     response = client.get("/api/v1/items/1")
     assert response.status_code == 200
     data = response.json()
@@ -38,14 +70,29 @@ def test_get_item():
     assert data["api_version"] == "v1"
 
 
-def test_get_item_not_found():
+def test_get_item_not_found(client):
     response = client.get("/api/v1/items/999")
     assert response.status_code == 404
     assert response.json() == {"detail": "Item not found"}
 
 
-def test_create_item():
+def test_create_item(client):
     new_item = {"id": 3, "name": "New Item"}
     response = client.post("/api/v1/items", json=new_item)
     assert response.status_code == 200
-    assert response.json()["item"] == new_item
\ No newline at end of file
+    assert response.json()["item"] == new_item
+
+
+def test_routes_default_to_orjson_response():
+    api_routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    assert api_routes
+    for route in api_routes:
+        assert route.response_class is ORJSONResponse
+
+
+def test_startup_warms_deployment_secret():
+    with patch("app.main.get_secrets_manager") as mock_get_sm:
+        mock_get_sm.return_value.get_secret_async = AsyncMock()
+        with TestClient(app):
+            pass
+    mock_get_sm.return_value.get_secret_async.assert_awaited_once_with(settings.deployment_secrets_name)
@@ -0,0 +1,166 @@
+"""
+Tests for the scripts/manage_secrets.py CLI.
+"""
+
+import argparse
+
+import orjson
+import pytest
+
+from manage_secrets import SecretsManagerCLI, _parse_kv
+
+
+class _NotFound(Exception):
+    pass
+
+
+class FakeClient:
+    """In-memory stand-in for the Secrets Manager client, recording every call."""
+
+    class exceptions:
+        ResourceNotFoundException = _NotFound
+
+    def __init__(self, secrets=None):
+        self.secrets = {name: orjson.dumps(value).decode() for name, value in (secrets or {}).items()}
+        self.calls = []
+
+    def get_secret_value(self, SecretId):
+        self.calls.append(("get_secret_value", SecretId))
+        if SecretId not in self.secrets:
+            raise _NotFound(SecretId)
+        return {"SecretString": self.secrets[SecretId]}
+
+    def describe_secret(self, SecretId):
+        self.calls.append(("describe_secret", SecretId))
+        if SecretId not in self.secrets:
+            raise _NotFound(SecretId)
+        return {"Name": SecretId}
+
+    def update_secret(self, SecretId, SecretString):
+        self.calls.append(("update_secret", SecretId))
+        self.secrets[SecretId] = SecretString
+
+    def create_secret(self, Name, SecretString):
+        self.calls.append(("create_secret", Name))
+        self.secrets[Name] = SecretString
+
+
+@pytest.fixture
+def parser():
+    return argparse.ArgumentParser()
+
+
+class TestParseKV:
+    def test_pairs(self, parser):
+        assert _parse_kv(parser, ["a=1", "b=c=d"]) == {"a": "1", "b": "c=d"}
+
+    def test_legacy_key_value(self, parser):
+        assert _parse_kv(parser, ["jwt_secret", "my=value"]) == {"jwt_secret": "my=value"}
+
+    @pytest.mark.parametrize("items", [["=v"], ["a=1", "=v"], ["", "v"], ["a=1", "b"]])
+    def test_rejects_invalid(self, parser, items):
+        with pytest.raises(SystemExit):
+            _parse_kv(parser, items)
+
+
+class TestSetSecrets:
+    def test_creates_missing_secret_without_failed_update(self):
+        client = FakeClient()
+        cli = SecretsManagerCLI(client=client)
+
+        cli.set_app_secrets({"jwt_secret": "jwt", "db_password": "db"})
+
+        assert client.calls == [
+            ("get_secret_value", "FastAPIAppSecrets"),
+            ("create_secret", "FastAPIAppSecrets"),
+        ]
+        assert orjson.loads(client.secrets["FastAPIAppSecrets"]) == {"jwt_secret": "jwt", "db_password": "db"}
+
+    def test_updates_existing_secret_once(self):
+        client = FakeClient({"FastAPIAppSecrets": {"jwt_secret": "old", "api_keys": "k"}})
+        cli = SecretsManagerCLI(client=client)
+
+        cli.set_app_secrets({"jwt_secret": "new", "db_password": "db"})
+
+        assert client.calls == [
+            ("get_secret_value", "FastAPIAppSecrets"),
+            ("update_secret", "FastAPIAppSecrets"),
+        ]
+        assert orjson.loads(client.secrets["FastAPIAppSecrets"]) == {
+            "jwt_secret": "new", "api_keys": "k", "db_password": "db"
+        }
+
+    def test_update_secret_describes_unknown_secret(self):
+        client = FakeClient({"FastAPIDeploymentSecrets": {}})
+        cli = SecretsManagerCLI(client=client)
+
+        cli.update_secret("FastAPIDeploymentSecrets", {"ec2_host": "h"})
+        cli.update_secret("NewSecret", {"k": "v"})
+
+        assert client.calls == [
+            ("describe_secret", "FastAPIDeploymentSecrets"),
+            ("update_secret", "FastAPIDeploymentSecrets"),
+            ("describe_secret", "NewSecret"),
+            ("create_secret", "NewSecret"),
+        ]
+
+    def test_unchanged_values_skip_write(self, capsys):
+        client = FakeClient({"FastAPIDeploymentSecrets": {"ec2_host": "h"}})
+        cli = SecretsManagerCLI(client=client)
+
+        cli.set_deployment_secret("ec2_host", "h")
+
+        assert client.calls == [("get_secret_value", "FastAPIDeploymentSecrets")]
+        assert "ec2_host already set" in capsys.readouterr().out
+
+    def test_known_secrets_skip_fetch(self):
+        client = FakeClient()
+        cli = SecretsManagerCLI(client=client)
+
+        cli.set_app_secret("jwt_secret", "jwt", secrets={"jwt_secret": "jwt"})
+
+        assert client.calls == []
+
+    def test_known_secrets_without_existence_still_describes(self):
+        client = FakeClient({"FastAPIAppSecrets": {"jwt_secret": "old"}})
+        cli = SecretsManagerCLI(client=client)
+
+        cli.set_app_secret("jwt_secret", "new", secrets={"jwt_secret": "old"})
+
+        assert client.calls == [
+            ("describe_secret", "FastAPIAppSecrets"),
+            ("update_secret", "FastAPIAppSecrets"),
+        ]
+
+    def test_known_secrets_and_existence_write_once(self):
+        client = FakeClient({"FastAPIAppSecrets": {"jwt_secret": "old"}})
+        cli = SecretsManagerCLI(client=client)
+
+        cli.set_app_secret("jwt_secret", "new", secrets={"jwt_secret": "old"}, exists=True)
+
+        assert client.calls == [("update_secret", "FastAPIAppSecrets")]
+        assert cli.get_secret("FastAPIAppSecrets") == {"jwt_secret": "new"}
+
+
+class TestListSecrets:
+    def test_get_secrets_keeps_requested_order(self, capsys):
+        client = FakeClient({"A": {"a": "1"}, "B": {"b": "2"}})
+        cli = SecretsManagerCLI(client=client)
+
+        assert cli.get_secrets(["B", "Missing", "A"]) == [{"b": "2"}, {}, {"a": "1"}]
+        assert "Secret Missing not found" in capsys.readouterr().out
+
+    def test_lists_keys_under_headers(self, capsys):
+        client = FakeClient({"FastAPIAppSecrets": {"jwt_secret": "j", "api_key": "k"}})
+        cli = SecretsManagerCLI(client=client)
+
+        cli.list_secrets()
+
+        out = capsys.readouterr().out
+        assert "Secret FastAPIDeploymentSecrets not found" in out
+        assert out.endswith(
+            "\n=== Application Secrets ===\n"
+            "  - jwt_secret\n"
+            "  - api_key\n"
+            "\n=== Deployment Secrets ===\n"
+        )
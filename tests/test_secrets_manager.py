@@ -2,156 +2,203 @@
 Tests for AWS Secrets Manager integration.
 """
 
+import asyncio
 import json
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 from botocore.exceptions import ClientError
 
 from app.secrets_manager import (
+    _CLIENT_CONFIG,
     SecretsManager,
+    _env_override,
+    _getenv,
+    _session,
     get_secrets_manager,
     get_app_secret,
     get_deployment_secret,
 )
 
+_TEST_SECRET = {"key1": "value1", "key2": "value2"}
+_SECRET_STRING_RESPONSE = {"SecretString": json.dumps(_TEST_SECRET)}
+_NOT_FOUND_ERROR = ClientError(error_response={"Error": {"Code": "ResourceNotFoundException"}}, operation_name="GetSecretValue")
+_ACCESS_DENIED_ERROR = ClientError(error_response={"Error": {"Code": "AccessDeniedException"}}, operation_name="GetSecretValue")
+_UNKNOWN_ERROR = ClientError(error_response={"Error": {"Code": "UnknownError"}}, operation_name="GetSecretValue")
+
+
+@pytest.fixture(autouse=True)
+def _clear_env_cache():
+    """Reset memoized environment lookups around tests that patch os.environ."""
+    _env_override.cache_clear()
+    _getenv.cache_clear()
+    yield
+    _env_override.cache_clear()
+    _getenv.cache_clear()
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Unset only the variables the secrets helpers read, instead of clearing os.environ."""
+    for key in ("AWS_REGION", "JWT_SECRET", "APP_SECRETS_NAME", "DEPLOYMENT_SECRETS_NAME"):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
 
 class TestSecretsManager:
     """Test the SecretsManager class."""
 
-    def test_init_default_region(self):
+    @pytest.fixture(scope="class", autouse=True)
+    def _mock_boto(self, request):
+        """Hand every SecretsManager built in these tests the same mock client."""
+        request.cls.mock_client = Mock()
+        request.cls.mock_boto_client = Mock(return_value=request.cls.mock_client)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(_session, "client", request.cls.mock_boto_client)
+            yield
+
+    @pytest.fixture(autouse=True)
+    def reset_mock(self, _mock_boto):
+        """Clear calls and per-test return values/side effects on the shared mocks."""
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+        self.mock_boto_client.reset_mock()
+
+    @pytest.fixture
+    def sm(self, reset_mock) -> SecretsManager:
+        return SecretsManager()
+
+    def test_init_default_region(self, mocker):
         """Test initialization with default region."""
-        with patch.dict(os.environ, {"AWS_REGION": "us-west-2"}):
-            sm = SecretsManager()
-            assert sm.region_name == "us-west-2"
+        mocker.patch.dict(os.environ, {"AWS_REGION": "us-west-2"})
+        sm = SecretsManager()
+        assert sm.region_name == "us-west-2"
 
     def test_init_explicit_region(self):
         """Test initialization with explicit region."""
         sm = SecretsManager(region_name="eu-west-1")
         assert sm.region_name == "eu-west-1"
 
-    def test_init_fallback_region(self):
+    def test_init_fallback_region(self, clean_env):
         """Test initialization falls back to us-east-1."""
-        with patch.dict(os.environ, {}, clear=True):
-            sm = SecretsManager()
-            assert sm.region_name == "us-east-1"
+        sm = SecretsManager()
+        assert sm.region_name == "us-east-1"
+
+    def test_init_uses_tuned_client_config(self):
+        """Test the client is built with the shared pooled/keep-alive config."""
+        SecretsManager(region_name="eu-west-1")
+
+        self.mock_boto_client.assert_called_once_with("secretsmanager", region_name="eu-west-1", config=_CLIENT_CONFIG)
+        assert _CLIENT_CONFIG.max_pool_connections == 50
+        assert _CLIENT_CONFIG.tcp_keepalive is True
 
     @pytest.mark.integration
-    @patch("boto3.client")
-    def test_get_secret_success(self, mock_boto_client):
+    def test_get_secret_success(self, sm):
         """Test successful secret retrieval."""
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
+        self.mock_client.get_secret_value.return_value = _SECRET_STRING_RESPONSE
 
-        test_secret = {"key1": "value1", "key2": "value2"}
-        mock_client.get_secret_value.return_value = {"SecretString": json.dumps(test_secret)}
-
-        sm = SecretsManager()
         result = sm.get_secret("test-secret")
 
-        assert result == test_secret
-        mock_client.get_secret_value.assert_called_once_with(SecretId="test-secret")
+        assert result == _TEST_SECRET
+        self.mock_client.get_secret_value.assert_called_once_with(SecretId="test-secret")
 
-    @pytest.mark.integration
-    @patch("boto3.client")
-    def test_get_secret_not_found(self, mock_boto_client):
-        """Test secret not found error."""
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
+    def test_get_secret_cached_within_ttl(self, sm):
+        """Test repeat lookups are served from cache while fresh."""
+        self.mock_client.get_secret_value.return_value = _SECRET_STRING_RESPONSE
 
-        error = ClientError(error_response={"Error": {"Code": "ResourceNotFoundException"}}, operation_name="GetSecretValue")
-        mock_client.get_secret_value.side_effect = error
+        first = sm.get_secret("test-secret")
+        second = sm.get_secret("test-secret")
 
-        sm = SecretsManager()
+        assert first == second == _TEST_SECRET
+        self.mock_client.get_secret_value.assert_called_once_with(SecretId="test-secret")
+
+    def test_get_secret_refetched_after_ttl(self, mocker):
+        """Test an expired cache entry is fetched again."""
+        self.mock_client.get_secret_value.side_effect = [
+            {"SecretString": json.dumps({"key1": "old"})},
+            {"SecretString": json.dumps({"key1": "new"})},
+        ]
+
+        sm = SecretsManager(ttl_seconds=300)
+        mocker.patch("app.secrets_manager.time.monotonic", side_effect=[0.0, 301.0, 301.0])
+        assert sm.get_secret("test-secret") == {"key1": "old"}
+        assert sm.get_secret("test-secret") == {"key1": "new"}
+
+        assert self.mock_client.get_secret_value.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_secret_async_fetches_then_caches(self, sm, mocker):
+        """Test async lookups fetch off the event loop once, then hit the cache."""
+        self.mock_client.get_secret_value.return_value = _SECRET_STRING_RESPONSE
+
+        mock_to_thread = mocker.patch("app.secrets_manager.asyncio.to_thread", wraps=asyncio.to_thread)
+        assert await sm.get_secret_async("test-secret") == _TEST_SECRET
+        assert await sm.get_secret_value_async("test-secret", "key1") == "value1"
+
+        mock_to_thread.assert_called_once_with(sm.get_secret, "test-secret")
+        self.mock_client.get_secret_value.assert_called_once_with(SecretId="test-secret")
+
+    @pytest.mark.asyncio
+    async def test_get_secret_value_async_error_returns_default(self, sm):
+        """Test async value lookup falls back to default on a missing secret."""
+        self.mock_client.get_secret_value.side_effect = _NOT_FOUND_ERROR
+
+        assert await sm.get_secret_value_async("test-secret", "key1", "default") == "default"
+
+    @pytest.mark.integration
+    def test_get_secret_not_found(self, sm):
+        """Test secret not found error."""
+        self.mock_client.get_secret_value.side_effect = _NOT_FOUND_ERROR
 
         with pytest.raises(ValueError, match="Secret test-secret not found"):
             sm.get_secret("test-secret")
 
     @pytest.mark.integration
-    @patch("boto3.client")
-    def test_get_secret_access_denied(self, mock_boto_client):
+    def test_get_secret_access_denied(self, sm):
         """Test access denied error."""
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
-
-        error = ClientError(error_response={"Error": {"Code": "AccessDeniedException"}}, operation_name="GetSecretValue")
-        mock_client.get_secret_value.side_effect = error
-
-        sm = SecretsManager()
+        self.mock_client.get_secret_value.side_effect = _ACCESS_DENIED_ERROR
 
         with pytest.raises(PermissionError, match="Access denied to secret test-secret"):
             sm.get_secret("test-secret")
 
     @pytest.mark.integration
-    @patch("boto3.client")
-    def test_get_secret_binary_not_supported(self, mock_boto_client):
+    def test_get_secret_binary_not_supported(self, sm):
         """Test binary secrets are not supported."""
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
-
-        mock_client.get_secret_value.return_value = {"SecretBinary": b"binary-data"}
-
-        sm = SecretsManager()
+        self.mock_client.get_secret_value.return_value = {"SecretBinary": b"binary-data"}
 
         with pytest.raises(ValueError, match="Binary secret test-secret is not supported"):
             sm.get_secret("test-secret")
 
     @pytest.mark.integration
-    @patch("boto3.client")
-    def test_get_secret_unknown_error(self, mock_boto_client):
+    def test_get_secret_unknown_error(self, sm):
         """Test unknown ClientError is re-raised."""
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
-
-        error = ClientError(error_response={"Error": {"Code": "UnknownError"}}, operation_name="GetSecretValue")
-        mock_client.get_secret_value.side_effect = error
-
-        sm = SecretsManager()
+        self.mock_client.get_secret_value.side_effect = _UNKNOWN_ERROR
 
         with pytest.raises(ClientError):
             sm.get_secret("test-secret")
 
     @pytest.mark.integration
-    @patch("boto3.client")
-    def test_get_secret_value_success(self, mock_boto_client):
+    def test_get_secret_value_success(self, sm):
         """Test getting specific value from secret."""
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
-
-        test_secret = {"key1": "value1", "key2": "value2"}
-        mock_client.get_secret_value.return_value = {"SecretString": json.dumps(test_secret)}
+        self.mock_client.get_secret_value.return_value = _SECRET_STRING_RESPONSE
 
-        sm = SecretsManager()
         result = sm.get_secret_value("test-secret", "key1")
 
         assert result == "value1"
 
     @pytest.mark.integration
-    @patch("boto3.client")
-    def test_get_secret_value_with_default(self, mock_boto_client):
+    def test_get_secret_value_with_default(self, sm):
         """Test getting value with default fallback."""
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
+        self.mock_client.get_secret_value.return_value = _SECRET_STRING_RESPONSE
 
-        test_secret = {"key1": "value1"}
-        mock_client.get_secret_value.return_value = {"SecretString": json.dumps(test_secret)}
-
-        sm = SecretsManager()
         result = sm.get_secret_value("test-secret", "missing_key", "default_value")
 
         assert result == "default_value"
 
-    @patch("boto3.client")
-    def test_get_secret_value_error_returns_default(self, mock_boto_client):
+    def test_get_secret_value_error_returns_default(self, sm):
         """Test error in get_secret_value returns default."""
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
-
-        error = ClientError(error_response={"Error": {"Code": "ResourceNotFoundException"}}, operation_name="GetSecretValue")
-        mock_client.get_secret_value.side_effect = error
+        self.mock_client.get_secret_value.side_effect = _NOT_FOUND_ERROR
 
-        sm = SecretsManager()
         result = sm.get_secret_value("test-secret", "key1", "default")
 
         assert result == "default"
@@ -160,18 +207,20 @@ class TestSecretsManager:
 class TestGlobalFunctions:
     """Test module-level convenience functions."""
 
+    @pytest.fixture
+    def fresh_secrets_manager(self):
+        """Start with no cached singleton and drop whatever the test cached."""
+        get_secrets_manager.cache_clear()
+        yield
+        get_secrets_manager.cache_clear()
+
     @pytest.mark.integration
-    @patch("app.secrets_manager.SecretsManager")
-    def test_get_secrets_manager_singleton(self, mock_sm_class):
+    def test_get_secrets_manager_singleton(self, mocker, fresh_secrets_manager):
         """Test global secrets manager is singleton."""
+        mock_sm_class = mocker.patch("app.secrets_manager.SecretsManager")
         mock_instance = Mock()
         mock_sm_class.return_value = mock_instance
 
-        # Clear any existing instance
-        import app.secrets_manager
-
-        app.secrets_manager._secrets_manager = None
-
         # First call creates instance
         result1 = get_secrets_manager()
         # Second call returns same instance
@@ -181,17 +230,25 @@ class TestGlobalFunctions:
         mock_sm_class.assert_called_once()
 
     @pytest.mark.integration
-    @patch.dict(os.environ, {"JWT_SECRET": "env-jwt-secret"})
-    def test_get_app_secret_from_env(self):
+    def test_get_app_secret_from_env(self, mocker):
         """Test getting secret from environment variable first."""
+        mocker.patch.dict(os.environ, {"JWT_SECRET": "env-jwt-secret"})
         result = get_app_secret("jwt_secret", "default")
         assert result == "env-jwt-secret"
 
+    def test_get_app_secret_env_lookup_memoized(self, mocker):
+        """Test environment overrides are read once per process."""
+        mocker.patch.dict(os.environ, {"JWT_SECRET": "first"})
+        assert get_app_secret("jwt_secret") == "first"
+        mocker.patch.dict(os.environ, {"JWT_SECRET": "second"})
+        assert get_app_secret("jwt_secret") == "first"
+        _env_override.cache_clear()
+        assert get_app_secret("jwt_secret") == "second"
+
     @pytest.mark.integration
-    @patch.dict(os.environ, {}, clear=True)
-    @patch("app.secrets_manager.get_secrets_manager")
-    def test_get_app_secret_from_secrets_manager(self, mock_get_sm):
+    def test_get_app_secret_from_secrets_manager(self, mocker, clean_env):
         """Test getting secret from Secrets Manager when env var not set."""
+        mock_get_sm = mocker.patch("app.secrets_manager.get_secrets_manager")
         mock_sm = Mock()
         mock_get_sm.return_value = mock_sm
         mock_sm.get_secret_value.return_value = "sm-jwt-secret"
@@ -201,10 +258,9 @@ class TestGlobalFunctions:
         assert result == "sm-jwt-secret"
         mock_sm.get_secret_value.assert_called_once_with("FastAPIAppSecrets", "jwt_secret", "default")
 
-    @patch.dict(os.environ, {}, clear=True)
-    @patch("app.secrets_manager.get_secrets_manager")
-    def test_get_app_secret_fallback_to_default(self, mock_get_sm):
+    def test_get_app_secret_fallback_to_default(self, mocker, clean_env):
         """Test fallback to default when Secrets Manager fails."""
+        mock_get_sm = mocker.patch("app.secrets_manager.get_secrets_manager")
         mock_sm = Mock()
         mock_get_sm.return_value = mock_sm
         mock_sm.get_secret_value.side_effect = Exception("AWS error")
@@ -213,10 +269,10 @@ class TestGlobalFunctions:
 
         assert result == "default"
 
-    @patch.dict(os.environ, {"APP_SECRETS_NAME": "CustomAppSecrets"})
-    @patch("app.secrets_manager.get_secrets_manager")
-    def test_get_app_secret_custom_name(self, mock_get_sm):
+    def test_get_app_secret_custom_name(self, mocker):
         """Test using custom secret name from environment."""
+        mocker.patch.dict(os.environ, {"APP_SECRETS_NAME": "CustomAppSecrets"})
+        mock_get_sm = mocker.patch("app.secrets_manager.get_secrets_manager")
         mock_sm = Mock()
         mock_get_sm.return_value = mock_sm
         mock_sm.get_secret_value.return_value = "secret-value"
@@ -226,9 +282,9 @@ class TestGlobalFunctions:
         mock_sm.get_secret_value.assert_called_once_with("CustomAppSecrets", "jwt_secret", None)
 
     @pytest.mark.integration
-    @patch("app.secrets_manager.get_secrets_manager")
-    def test_get_deployment_secret_success(self, mock_get_sm):
+    def test_get_deployment_secret_success(self, mocker):
         """Test successful deployment secret retrieval."""
+        mock_get_sm = mocker.patch("app.secrets_manager.get_secrets_manager")
         mock_sm = Mock()
         mock_get_sm.return_value = mock_sm
         mock_sm.get_secret_value.return_value = "ec2-host-value"
@@ -238,9 +294,9 @@ class TestGlobalFunctions:
         assert result == "ec2-host-value"
         mock_sm.get_secret_value.assert_called_once_with("FastAPIDeploymentSecrets", "ec2_host", "default")
 
-    @patch("app.secrets_manager.get_secrets_manager")
-    def test_get_deployment_secret_error_fallback(self, mock_get_sm):
+    def test_get_deployment_secret_error_fallback(self, mocker):
         """Test deployment secret fallback on error."""
+        mock_get_sm = mocker.patch("app.secrets_manager.get_secrets_manager")
         mock_sm = Mock()
         mock_get_sm.return_value = mock_sm
         mock_sm.get_secret_value.side_effect = Exception("AWS error")
@@ -249,10 +305,10 @@ class TestGlobalFunctions:
 
         assert result == "default"
 
-    @patch.dict(os.environ, {"DEPLOYMENT_SECRETS_NAME": "CustomDeploySecrets"})
-    @patch("app.secrets_manager.get_secrets_manager")
-    def test_get_deployment_secret_custom_name(self, mock_get_sm):
+    def test_get_deployment_secret_custom_name(self, mocker):
         """Test using custom deployment secret name."""
+        mocker.patch.dict(os.environ, {"DEPLOYMENT_SECRETS_NAME": "CustomDeploySecrets"})
+        mock_get_sm = mocker.patch("app.secrets_manager.get_secrets_manager")
         mock_sm = Mock()
         mock_get_sm.return_value = mock_sm
         mock_sm.get_secret_value.return_value = "secret-value"